@@ -1,5 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.paginator import Paginator
+from django.db import OperationalError, connections, transaction
+from django.utils.functional import cached_property
 
 from .models import (
     Campaign,
@@ -12,9 +15,54 @@ from .models import (
     UserStripeAccount,
 )
 
+USER_EXTRA_FIELDSETS = (("Additional Info", {"fields": ("phone", "address", "is_moderator")}),)
+
+# Below this many estimated rows an exact COUNT is cheap, so the estimate is not used
+APPROX_COUNT_THRESHOLD = 10000
+FILTERED_COUNT_TIMEOUT = "500ms"
+
+
+class ApproxCountPaginator(Paginator):
+    """
+    Admin paginator that avoids a full COUNT(*) on large PostgreSQL tables.
+
+    Unfiltered changelists use the planner's row estimate from pg_class; filtered ones
+    run the exact count under a statement timeout and fall back to the estimate.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return super().count
+
+        estimate = self._estimated_rows(connection, queryset.model._meta.db_table)
+        if estimate < APPROX_COUNT_THRESHOLD:
+            return super().count
+        if not queryset.query.where:
+            return estimate
+
+        try:
+            with transaction.atomic(using=queryset.db), connection.cursor() as cursor:
+                cursor.execute(f"SET LOCAL statement_timeout = '{FILTERED_COUNT_TIMEOUT}'")
+                return queryset.count()
+        except OperationalError:
+            return estimate
+
+    @staticmethod
+    def _estimated_rows(connection, table_name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table_name])
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        return row[0] if row and row[0] > 0 else 0
+
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     list_display = [
         "email",
         "username",
@@ -24,7 +72,7 @@ class UserAdmin(BaseUserAdmin):
         "is_active",
     ]
     list_filter = ["is_moderator", "is_staff", "is_active"]
-    fieldsets = BaseUserAdmin.fieldsets + (("Additional Info", {"fields": ("phone", "address", "is_moderator")}),)
+    fieldsets = BaseUserAdmin.fieldsets + USER_EXTRA_FIELDSETS
 
 
 class CampaignMediaInline(admin.TabularInline):
@@ -34,6 +82,8 @@ class CampaignMediaInline(admin.TabularInline):
 
 @admin.register(Campaign)
 class CampaignAdmin(admin.ModelAdmin):
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     list_display = [
         "title",
         "created_by",
@@ -43,29 +93,67 @@ class CampaignAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["status", "created_at"]
+    list_select_related = ("created_by",)
     search_fields = ["title", "description"]
+    raw_id_fields = ["created_by"]
     readonly_fields = ["current_amount", "created_at", "updated_at"]
     inlines = [CampaignMediaInline]
 
+    def get_queryset(self, request):
+        # Change and delete views fetch the owner in the same query as the campaign
+        queryset = super().get_queryset(request).select_related("created_by")
+        changelist_url_name = f"{self.opts.app_label}_{self.opts.model_name}_changelist"
+        if request.resolver_match and request.resolver_match.url_name == changelist_url_name:
+            # The changelist never renders the HTML body or notes; the change form still loads them
+            queryset = queryset.defer("description", "moderation_notes")
+        return queryset
+
 
 @admin.register(Donation)
 class DonationAdmin(admin.ModelAdmin):
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     list_display = ["campaign", "amount", "created_at"]
     list_filter = ["created_at"]
+    list_select_related = ("campaign",)
     search_fields = ["campaign__title"]
+    raw_id_fields = ["campaign"]
     readonly_fields = ["created_at"]
     # All donations are anonymous - no donor information is stored or displayed
 
+    def get_queryset(self, request):
+        # Rows only show the campaign title, so skip its HTML body and notes in the join
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("campaign")
+            .defer("campaign__description", "campaign__moderation_notes")
+        )
+
 
 @admin.register(ModerationHistory)
 class ModerationHistoryAdmin(admin.ModelAdmin):
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     list_display = ["campaign", "moderator", "action", "created_at"]
     list_filter = ["action", "created_at"]
+    list_select_related = ("campaign", "moderator")
+    raw_id_fields = ["campaign", "moderator"]
     readonly_fields = ["created_at"]
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("campaign", "moderator")
+            .defer("campaign__description", "campaign__moderation_notes")
+        )
+
 
 @admin.register(UserStripeAccount)
 class UserStripeAccountAdmin(admin.ModelAdmin):
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     list_display = [
         "user",
         "stripe_account_id",
@@ -75,6 +163,7 @@ class UserStripeAccountAdmin(admin.ModelAdmin):
         "last_synced_at",
     ]
     list_filter = ["charges_enabled", "payouts_enabled", "details_submitted"]
+    list_select_related = ("user",)
     search_fields = ["user__email", "user__username", "stripe_account_id"]
     readonly_fields = [
         "user",
@@ -98,6 +187,8 @@ class NewsMediaInline(admin.TabularInline):
 
 @admin.register(News)
 class NewsAdmin(admin.ModelAdmin):
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     list_display = ["title", "published", "created_at"]
     list_filter = ["published", "created_at"]
     inlines = [NewsMediaInline]
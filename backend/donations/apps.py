@@ -1,19 +1,50 @@
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from django.apps import AppConfig
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Management commands that never serve traffic, so MinIO bootstrapping and network diagnostics are skipped
+MAINTENANCE_COMMANDS = {
+    "makemigrations",
+    "migrate",
+    "collectstatic",
+    "createsuperuser",
+    "shell",
+    "dbshell",
+    "test",
+}
+
+
+def is_maintenance_run():
+    """Return True for management commands and test runs that do not need external services."""
+    if "pytest" in sys.modules:
+        return True
+    return len(sys.argv) > 1 and sys.argv[1] in MAINTENANCE_COMMANDS
+
 
 class DonationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "donations"
 
+    _s3_client = None
+    _s3_client_lock = threading.Lock()
+
     def ready(self):
         super().ready()
+        from . import signals  # noqa: F401  (registers cache invalidation handlers)
+
+        if is_maintenance_run():
+            return
+
         self._ensure_storage_bucket()
-        self._log_startup_diagnostics()
+        if getattr(settings, "RUN_STARTUP_CHECKS", True):
+            # Diagnostics only log results, so they run off the startup path
+            threading.Thread(target=self._log_startup_diagnostics, name="startup-diagnostics", daemon=True).start()
 
     def _ensure_storage_bucket(self):
         if not getattr(settings, "USE_S3_STORAGE", False):
@@ -25,28 +56,15 @@ class DonationsConfig(AppConfig):
             return
 
         try:
-            import boto3
             from botocore.exceptions import ClientError
         except ImportError:
             logger.warning("boto3 is required to ensure MinIO/S3 bucket but is not installed.")
             return
 
-        client_kwargs = {
-            "service_name": "s3",
-            "aws_access_key_id": getattr(settings, "AWS_ACCESS_KEY_ID", None),
-            "aws_secret_access_key": getattr(settings, "AWS_SECRET_ACCESS_KEY", None),
-        }
-
-        endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", None)
-        if endpoint_url:
-            client_kwargs["endpoint_url"] = endpoint_url
-
         region_name = getattr(settings, "AWS_S3_REGION_NAME", None)
-        if region_name:
-            client_kwargs["region_name"] = region_name
 
         try:
-            s3_client = boto3.client(**client_kwargs)
+            s3_client = self._get_startup_s3_client()
         except Exception as exc:
             logger.warning("Unable to initialize S3 client for bucket creation: %s", exc)
             return
@@ -72,11 +90,56 @@ class DonationsConfig(AppConfig):
         except Exception as exc:
             logger.warning("Unexpected error while ensuring bucket '%s': %s", bucket_name, exc)
 
+    def get_s3_client(self):
+        """Return the shared MinIO/S3 client used to serve media, creating it on first use."""
+        # boto3 clients are thread-safe, so one client and its connection pool serve every caller.
+        # Its read timeout applies between body reads, so it must allow slow streams of large objects.
+        if self._s3_client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = self._build_s3_client(read_timeout=60, max_pool_connections=50)
+        return self._s3_client
+
+    def _get_startup_s3_client(self):
+        # Bucket bootstrapping and diagnostics should fail fast instead of holding up startup
+        return self._build_s3_client(read_timeout=5)
+
+    def _build_s3_client(self, read_timeout, max_pool_connections=10):
+        import boto3
+        from botocore.config import Config
+
+        client_kwargs = {
+            "service_name": "s3",
+            "aws_access_key_id": getattr(settings, "AWS_ACCESS_KEY_ID", None),
+            "aws_secret_access_key": getattr(settings, "AWS_SECRET_ACCESS_KEY", None),
+            "config": Config(
+                connect_timeout=3,
+                read_timeout=read_timeout,
+                retries={"max_attempts": 2},
+                max_pool_connections=max_pool_connections,
+            ),
+        }
+
+        endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", None)
+        if endpoint_url:
+            client_kwargs["endpoint_url"] = endpoint_url
+
+        region_name = getattr(settings, "AWS_S3_REGION_NAME", None)
+        if region_name:
+            client_kwargs["region_name"] = region_name
+
+        return boto3.session.Session().client(**client_kwargs)
+
     def _log_startup_diagnostics(self):
-        self._check_database()
-        self._check_minio()
-        self._check_stripe()
-        self._check_frontend()
+        checks = [self._check_database, self._check_minio, self._check_stripe, self._check_frontend]
+        # Each check is network-bound, so running them together costs the slowest check rather than the sum
+        with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="startup-check") as executor:
+            futures = {executor.submit(check): check.__name__ for check in checks}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.error("Startup check %s raised an unexpected error: %s", futures[future], exc)
 
     def _check_database(self):
         from django.db import connection
@@ -87,6 +150,9 @@ class DonationsConfig(AppConfig):
             logger.info("Startup check: PostgreSQL database connection successful.")
         except Exception as exc:
             logger.error("Startup check: PostgreSQL database connection failed: %s", exc)
+        finally:
+            # Connections are per-thread; release the one opened by this worker thread
+            connection.close()
 
     def _check_minio(self):
         if not getattr(settings, "USE_S3_STORAGE", False):
@@ -99,28 +165,13 @@ class DonationsConfig(AppConfig):
             return
 
         try:
-            import boto3
             from botocore.exceptions import ClientError
         except ImportError:
             logger.warning("Startup check: boto3 not installed; cannot verify MinIO/S3.")
             return
 
-        client_kwargs = {
-            "service_name": "s3",
-            "aws_access_key_id": getattr(settings, "AWS_ACCESS_KEY_ID", None),
-            "aws_secret_access_key": getattr(settings, "AWS_SECRET_ACCESS_KEY", None),
-        }
-
-        endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", None)
-        if endpoint_url:
-            client_kwargs["endpoint_url"] = endpoint_url
-
-        region_name = getattr(settings, "AWS_S3_REGION_NAME", None)
-        if region_name:
-            client_kwargs["region_name"] = region_name
-
         try:
-            s3_client = boto3.client(**client_kwargs)
+            s3_client = self._get_startup_s3_client()
             s3_client.head_bucket(Bucket=bucket_name)
             logger.info("Startup check: MinIO/S3 bucket '%s' reachable.", bucket_name)
         except ClientError as exc:
@@ -160,7 +211,7 @@ class DonationsConfig(AppConfig):
         try:
             import requests
 
-            response = requests.head(frontend_url, timeout=3)
+            response = requests.head(frontend_url, timeout=3, allow_redirects=False)
             logger.info(
                 "Startup check: Frontend at %s responded with HTTP %s.",
                 frontend_url,
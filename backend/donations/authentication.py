@@ -0,0 +1,129 @@
+"""
+Cached token -> user resolution shared by the token middleware and DRF
+authentication, the cached user -> token key lookup used by login, and the
+per-email login failure counter used by LoginSerializer.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+TOKEN_CACHE_PREFIX = "auth:token:"
+USER_TOKEN_CACHE_PREFIX = "auth:user_token:"
+LOGIN_FAILURE_PREFIX = "auth:login_fail:"
+
+
+def token_cache_key(token_key):
+    return f"{TOKEN_CACHE_PREFIX}{token_key}"
+
+
+def get_token_user(token_key):
+    """
+    Return the user owning ``token_key``, or None if the token does not exist.
+
+    Hits go to the cache instead of the token/user join; entries expire after
+    TOKEN_CACHE_TIMEOUT and are dropped early by the signal handlers in signals.py.
+    Without a shared cache every call reads the database, since a per-worker
+    entry would outlive a logout or deactivation handled by another worker.
+    """
+    if not getattr(settings, "SHARED_CACHE", False):
+        return _load_token_user(token_key)
+
+    cache_key = token_cache_key(token_key)
+    user = cache.get(cache_key)
+    if user is not None:
+        return user
+
+    user = _load_token_user(token_key)
+    if user is not None:
+        cache.set(cache_key, user, getattr(settings, "TOKEN_CACHE_TIMEOUT", 60))
+    return user
+
+
+def _load_token_user(token_key):
+    # Unknown tokens (stale links, scanners) are the common miss, so avoid the DoesNotExist path
+    token = Token.objects.select_related("user").filter(key=token_key).first()
+    return token.user if token is not None else None
+
+
+def invalidate_token(token_key, user_id=None):
+    keys = [token_cache_key(token_key)]
+    if user_id is not None:
+        keys.append(user_token_cache_key(user_id))
+    cache.delete_many(keys)
+
+
+def user_token_cache_key(user_id):
+    return f"{USER_TOKEN_CACHE_PREFIX}{user_id}"
+
+
+def get_user_token_key(user):
+    """
+    Return ``user``'s API token key, creating the token on first use.
+
+    Repeat logins skip the lookup only behind a shared cache; a per-worker entry
+    could still hold the key of a token another worker deleted on logout.
+    """
+    if not getattr(settings, "SHARED_CACHE", False):
+        token, _ = Token.objects.get_or_create(user=user)
+        return token.key
+
+    cache_key = user_token_cache_key(user.pk)
+    token_key = cache.get(cache_key)
+    if token_key is not None:
+        return token_key
+
+    token, _ = Token.objects.get_or_create(user=user)
+    cache.set(cache_key, token.key, getattr(settings, "TOKEN_CACHE_TIMEOUT", 60))
+    return token.key
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that resolves keys through get_token_user.
+
+    request.auth is the token key rather than a Token instance; nothing in the API reads it.
+    """
+
+    def authenticate_credentials(self, key):
+        user = get_token_user(key)
+        if user is None:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        return (user, key)
+
+
+def login_failure_cache_key(email):
+    return f"{LOGIN_FAILURE_PREFIX}{email.lower()}"
+
+
+def login_attempts_exhausted(email):
+    """
+    Return True once ``email`` has hit LOGIN_FAILURE_LIMIT failures inside the current window.
+
+    The counter lives in the default cache. Without a shared cache each worker counts on its
+    own, so the effective limit is only approximate: anywhere from LOGIN_FAILURE_LIMIT up to
+    that many failures per worker, and a successful login only resets its own worker's count.
+    """
+    return cache.get(login_failure_cache_key(email), 0) >= getattr(settings, "LOGIN_FAILURE_LIMIT", 5)
+
+
+def record_login_failure(email):
+    # The window starts at the first failure; incr keeps the original expiry
+    cache_key = login_failure_cache_key(email)
+    cache.add(cache_key, 0, getattr(settings, "LOGIN_FAILURE_TIMEOUT", 900))
+    try:
+        cache.incr(cache_key)
+    except ValueError:
+        # Expired between add() and incr()
+        cache.set(cache_key, 1, getattr(settings, "LOGIN_FAILURE_TIMEOUT", 900))
+
+
+def reset_login_failures(email):
+    cache.delete(login_failure_cache_key(email))
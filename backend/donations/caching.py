@@ -0,0 +1,45 @@
+"""
+Response cache for the public news list.
+
+Entries are keyed by a generation token; any News or NewsMedia change replaces
+the token (see signals.py), so stale pages are never read again and simply expire.
+Callers read the token once per request, before querying, and store the page under
+that same token; a change committed mid-query then only touches an abandoned entry.
+The token only reaches every worker through a shared cache, so the view skips
+this cache unless SHARED_CACHE is set.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+NEWS_GENERATION_KEY = "news:generation"
+NEWS_LIST_PREFIX = "news:list:"
+
+
+def news_generation():
+    generation = cache.get(NEWS_GENERATION_KEY)
+    if generation is None:
+        # add() so concurrent first readers agree on one token
+        cache.add(NEWS_GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(NEWS_GENERATION_KEY)
+    return generation
+
+
+def news_list_cache_key(generation, host, page):
+    # Only what shapes the response: the host used in pagination links and media URLs, and the page.
+    # Other query parameters are ignored by the view, so they must not mint new entries.
+    return f"{NEWS_LIST_PREFIX}{generation}:{host}:{page}"
+
+
+def get_news_list(generation, host, page):
+    return cache.get(news_list_cache_key(generation, host, page))
+
+
+def set_news_list(generation, host, page, data):
+    cache.set(news_list_cache_key(generation, host, page), data, getattr(settings, "NEWS_CACHE_TIMEOUT", 120))
+
+
+def invalidate_news():
+    cache.set(NEWS_GENERATION_KEY, uuid.uuid4().hex, None)
@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 from rest_framework import status
 from rest_framework.response import Response
@@ -6,6 +9,29 @@ from rest_framework.views import exception_handler
 
 logger = logging.getLogger(__name__)
 
+# Identical unhandled errors are logged with a traceback at most once per interval
+EXCEPTION_LOG_INTERVAL = 1.0
+EXCEPTION_LOG_MAX_KEYS = 128
+UNEXPECTED_ERROR_DETAIL = "An unexpected error occurred"
+
+_last_logged = OrderedDict()
+_last_logged_lock = threading.Lock()
+
+
+def _should_log(exc):
+    """Return True unless the same kind of error was already logged within the interval."""
+    key = (type(exc).__name__, str(exc.args[0]) if exc.args else "")
+    now = time.monotonic()
+    with _last_logged_lock:
+        last = _last_logged.get(key)
+        if last is not None and now - last < EXCEPTION_LOG_INTERVAL:
+            return False
+        _last_logged[key] = now
+        _last_logged.move_to_end(key)
+        if len(_last_logged) > EXCEPTION_LOG_MAX_KEYS:
+            _last_logged.popitem(last=False)
+    return True
+
 
 def custom_exception_handler(exc, context):
     """
@@ -17,9 +43,11 @@ def custom_exception_handler(exc, context):
     # If we get None, it means DRF doesn't handle this exception
     # Return a JSON response instead of letting Django return HTML
     if response is None:
-        logger.exception("Unhandled exception occurred", exc_info=exc)
+        if _should_log(exc):
+            logger.exception("Unhandled exception occurred", exc_info=exc)
+        # The message can carry SQL or constraint names, so it only goes to the log
         return Response(
-            {"error": str(exc), "detail": "An unexpected error occurred"},
+            {"error": UNEXPECTED_ERROR_DETAIL, "detail": UNEXPECTED_ERROR_DETAIL},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
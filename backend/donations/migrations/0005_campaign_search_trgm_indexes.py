@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Admin search uses icontains, which PostgreSQL compiles to UPPER(column::text) LIKE UPPER('%term%').
+# Trigram GIN indexes over the same expression let those lookups use an index instead of a sequential scan.
+CAMPAIGN_TRGM_INDEXES = {
+    "campaign_title_trgm": "title",
+    "campaign_description_trgm": "description",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, column in CAMPAIGN_TRGM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON donations_campaign "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index_name in CAMPAIGN_TRGM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0004_userstripeaccount_dashboard_url"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
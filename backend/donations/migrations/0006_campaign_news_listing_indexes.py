@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0005_campaign_search_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=models.Index(fields=["status", "-created_at"], name="campaign_status_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(fields=["published", "-created_at"], name="news_published_created_idx"),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0008_user_search_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="donation",
+            name="stripe_payment_intent_id",
+            field=models.CharField(max_length=200),
+        ),
+        migrations.AddIndex(
+            model_name="donation",
+            index=models.Index(fields=["campaign", "-created_at"], name="donation_campaign_created_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="donation",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("stripe_payment_intent_id", ""), _negated=True),
+                fields=("stripe_payment_intent_id",),
+                name="donation_payment_intent_unique",
+            ),
+        ),
+    ]
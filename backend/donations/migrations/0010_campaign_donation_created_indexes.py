@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0009_donation_campaign_index_partial_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=models.Index(fields=["-created_at"], name="campaign_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="donation",
+            index=models.Index(fields=["-created_at"], name="donation_created_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("donations", "0010_campaign_donation_created_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="campaign",
+            constraint=models.CheckConstraint(
+                check=models.Q(("status__in", ["draft", "pending", "approved", "rejected", "suspended", "cancelled"])),
+                name="campaign_status_valid",
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -17,6 +18,10 @@ class User(AbstractUser):
     class Meta:
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [
+            # Moderators page through users newest first
+            models.Index(fields=["-date_joined"], name="user_date_joined_idx"),
+        ]
 
 
 class UserStripeAccount(models.Model):
@@ -53,39 +58,44 @@ class UserStripeAccount(models.Model):
         self.payouts_enabled = account_data.get("payouts_enabled", False)
         self.details_submitted = account_data.get("details_submitted", False)
         self.requirements_due = requirements.get("currently_due", [])
-        update_fields = [
-            "charges_enabled",
-            "payouts_enabled",
-            "details_submitted",
-            "requirements_due",
-            "dashboard_url",
-            "updated_at",
-        ]
-        if self.is_ready and (self.onboarding_url or self.onboarding_expires_at):
-            self.onboarding_url = ""
-            self.onboarding_expires_at = None
-            update_fields.extend(["onboarding_url", "onboarding_expires_at"])
-        self.save(update_fields=update_fields)
+        # auto_now fields are only stamped by save(), so set them explicitly for the UPDATE
+        self.last_synced_at = self.updated_at = timezone.now()
+        fields = {
+            "charges_enabled": self.charges_enabled,
+            "payouts_enabled": self.payouts_enabled,
+            "details_submitted": self.details_submitted,
+            "requirements_due": self.requirements_due,
+            "last_synced_at": self.last_synced_at,
+            "updated_at": self.updated_at,
+        }
+        # Onboarding fields are only cleared here; writing them back otherwise could replace
+        # a link stored since this instance was loaded with a stale one
+        if self.is_ready:
+            self.onboarding_url = fields["onboarding_url"] = ""
+            self.onboarding_expires_at = fields["onboarding_expires_at"] = None
+        UserStripeAccount.objects.filter(pk=self.pk).update(**fields)
+
+
+class CampaignStatus(models.TextChoices):
+    DRAFT = "draft", "Draft"
+    PENDING = "pending", "Pending Moderation"
+    APPROVED = "approved", "Approved"
+    REJECTED = "rejected", "Rejected"
+    SUSPENDED = "suspended", "Suspended"
+    CANCELLED = "cancelled", "Cancelled"
 
 
 class Campaign(models.Model):
     """Campaign model for fundraising."""
 
-    STATUS_CHOICES = [
-        ("draft", "Draft"),
-        ("pending", "Pending Moderation"),
-        ("approved", "Approved"),
-        ("rejected", "Rejected"),
-        ("suspended", "Suspended"),
-        ("cancelled", "Cancelled"),
-    ]
+    Status = CampaignStatus
 
     title = models.CharField(max_length=200)
     short_description = models.TextField()
     description = models.TextField()  # HTML from WYSIWYG
     target_amount = models.DecimalField(max_digits=10, decimal_places=2)
     current_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="draft")
+    status = models.CharField(max_length=20, choices=CampaignStatus.choices, default=CampaignStatus.DRAFT)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name="campaigns")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -94,6 +104,16 @@ class Campaign(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Public listing and moderation queues filter by status and sort newest first
+            models.Index(fields=["status", "-created_at"], name="campaign_status_created_idx"),
+            # Moderator and admin listings sort all campaigns newest first without a status filter
+            models.Index(fields=["-created_at"], name="campaign_created_idx"),
+        ]
+        constraints = [
+            # Writes through update() and raw SQL skip choices validation, so the database enforces it
+            models.CheckConstraint(check=models.Q(status__in=CampaignStatus.values), name="campaign_status_valid"),
+        ]
 
     def __str__(self):
         return self.title
@@ -106,7 +126,7 @@ class Campaign(models.Model):
 
     @property
     def is_visible(self):
-        return self.status == "approved"
+        return self.status == CampaignStatus.APPROVED
 
 
 class CampaignMedia(models.Model):
@@ -139,11 +159,24 @@ class Donation(models.Model):
     donor_name = models.CharField(max_length=100, blank=True)
     donor_email = models.EmailField(blank=True)
     is_anonymous = models.BooleanField(default=True)
-    stripe_payment_intent_id = models.CharField(max_length=200, unique=True)
+    stripe_payment_intent_id = models.CharField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Per-campaign donation listings filter by campaign and sort newest first
+            models.Index(fields=["campaign", "-created_at"], name="donation_campaign_created_idx"),
+            models.Index(fields=["-created_at"], name="donation_created_idx"),
+        ]
+        constraints = [
+            # Sessions without a payment intent are stored with an empty id and must not collide
+            models.UniqueConstraint(
+                fields=["stripe_payment_intent_id"],
+                condition=~models.Q(stripe_payment_intent_id=""),
+                name="donation_payment_intent_unique",
+            ),
+        ]
 
     def __str__(self):
         return f"${self.amount} to {self.campaign.title}"
@@ -177,6 +210,9 @@ class News(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["published", "-created_at"], name="news_published_created_idx"),
+        ]
 
     def __str__(self):
         return self.title if self.title else f"News {self.id}"
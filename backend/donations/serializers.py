@@ -1,7 +1,11 @@
+import copy
+
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
 from rest_framework import serializers
 
+from .authentication import login_attempts_exhausted, record_login_failure, reset_login_failures
 from .models import (
     Campaign,
     CampaignMedia,
@@ -10,11 +14,37 @@ from .models import (
     News,
     NewsMedia,
     User,
-    UserStripeAccount,
 )
 
+# Payload for users without a Stripe account; callers get a copy so mutating one response cannot leak into others
+STRIPE_ACCOUNT_ABSENT = {"has_account": False, "ready": False}
+
+
+def _media_type(upload):
+    return "video" if getattr(upload, "content_type", "").startswith("video/") else "image"
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class instead of once per instance.
+
+    ModelSerializer.get_fields introspects the model on every instantiation. The result only
+    depends on the class, so it is cached and each instance gets its own copies to bind.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = fields
+        # Field.__deepcopy__ re-instantiates from the constructor arguments, so copies start unbound
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
 
-class UserSerializer(serializers.ModelSerializer):
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     stripe = serializers.SerializerMethodField()
 
     class Meta:
@@ -44,23 +74,13 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
     def get_stripe(self, obj):
-        try:
-            account = obj.stripe_account
-        except UserStripeAccount.DoesNotExist:
-            return {
-                "has_account": False,
-                "ready": False,
-            }
-
-        onboarding_expires_at = account.onboarding_expires_at
-        if onboarding_expires_at:
-            try:
-                onboarding_expires_at = onboarding_expires_at.isoformat()
-            except AttributeError:
-                # Handle cases where the value is stored as a string or another non-datetime type
-                onboarding_expires_at = str(onboarding_expires_at)
-        else:
-            onboarding_expires_at = None
+        # The reverse one-to-one miss is an AttributeError subclass, so getattr covers users without an account
+        account = getattr(obj, "stripe_account", None)
+        if account is None:
+            return dict(STRIPE_ACCOUNT_ABSENT)
+
+        # DateTimeField, and only ever assigned timezone-aware datetimes
+        onboarding_expires_at = account.onboarding_expires_at.isoformat() if account.onboarding_expires_at else None
 
         return {
             "has_account": True,
@@ -91,10 +111,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop("password2")
         password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        # create_user hashes the password before the single INSERT
+        return User.objects.create_user(password=password, **validated_data)
 
 
 class LoginSerializer(serializers.Serializer):
@@ -106,9 +124,14 @@ class LoginSerializer(serializers.Serializer):
         password = attrs.get("password")
 
         if email and password:
+            # Refuse before authenticate() so repeated bad guesses don't each pay for a password hash
+            if login_attempts_exhausted(email):
+                raise serializers.ValidationError({"error": "Too many failed login attempts. Please try again later."})
             user = authenticate(request=self.context.get("request"), username=email, password=password)
             if not user:
+                record_login_failure(email)
                 raise serializers.ValidationError({"error": "Invalid credentials"})
+            reset_login_failures(email)
             if not user.is_active:
                 raise serializers.ValidationError({"error": "User account is disabled"})
             attrs["user"] = user
@@ -138,14 +161,14 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         return attrs
 
 
-class CampaignMediaSerializer(serializers.ModelSerializer):
+class CampaignMediaSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = CampaignMedia
         fields = ["id", "media_type", "file", "order"]
         read_only_fields = ["id"]
 
 
-class ModerationHistorySerializer(serializers.ModelSerializer):
+class ModerationHistorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     moderator = UserSerializer(read_only=True)
 
     class Meta:
@@ -154,13 +177,15 @@ class ModerationHistorySerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "moderator"]
 
 
-class CampaignSerializer(serializers.ModelSerializer):
+class CampaignSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     media = CampaignMediaSerializer(many=True, read_only=True)
     created_by = UserSerializer(read_only=True)
     progress_percentage = serializers.ReadOnlyField()
     stripe_ready = serializers.ReadOnlyField()
-    stripe_account_id = serializers.SerializerMethodField()
-    moderation_history = serializers.SerializerMethodField()
+    # DRF's attribute walk returns None when the owner has no Stripe account
+    stripe_account_id = serializers.CharField(
+        source="created_by.stripe_account.stripe_account_id", read_only=True, allow_null=True
+    )
 
     class Meta:
         model = Campaign
@@ -180,7 +205,6 @@ class CampaignSerializer(serializers.ModelSerializer):
             "moderation_notes",
             "stripe_ready",
             "stripe_account_id",
-            "moderation_history",
         ]
         read_only_fields = [
             "id",
@@ -192,18 +216,14 @@ class CampaignSerializer(serializers.ModelSerializer):
             "stripe_account_id",
         ]
 
-    def get_stripe_account_id(self, obj):
-        try:
-            account = obj.created_by.stripe_account
-        except UserStripeAccount.DoesNotExist:
-            return None
-        return account.stripe_account_id
 
-    def get_moderation_history(self, obj):
-        include_history = self.context.get("include_history", False)
-        if not include_history:
-            return []
+class CampaignWithHistorySerializer(CampaignSerializer):
+    moderation_history = serializers.SerializerMethodField()
 
+    class Meta(CampaignSerializer.Meta):
+        fields = CampaignSerializer.Meta.fields + ["moderation_history"]
+
+    def get_moderation_history(self, obj):
         history_qs = getattr(obj, "moderation_history", None)
         if history_qs is None:
             return []
@@ -211,11 +231,6 @@ class CampaignSerializer(serializers.ModelSerializer):
         serializer = ModerationHistorySerializer(history_qs.all(), many=True, context=self.context)
         return serializer.data
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if not self.context.get("include_history", False):
-            self.fields.pop("moderation_history", None)
-
 
 class CampaignCreateSerializer(serializers.ModelSerializer):
     media_files = serializers.ListField(child=serializers.FileField(), write_only=True, required=False)
@@ -231,24 +246,29 @@ class CampaignCreateSerializer(serializers.ModelSerializer):
             "media_files",
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
         media_files = validated_data.pop("media_files", [])
         # Get created_by from context (the request user)
         # Get status from validated_data if provided, otherwise default to "pending"
-        created_by = self.context["request"].user
-        status = validated_data.pop("status", "pending")
-        campaign = Campaign.objects.create(**validated_data, created_by=created_by, status=status)
-
-        for idx, media_file in enumerate(media_files[:6]):  # Limit to 6 files
-            media_type = (
-                "video"
-                if hasattr(media_file, "content_type") and media_file.content_type.startswith("video/")
-                else "image"
-            )
-            CampaignMedia.objects.create(campaign=campaign, media_type=media_type, file=media_file, order=idx)
+        # The campaign and its media rows commit together, so a failed upload leaves no orphan campaign
+        campaign = Campaign(
+            created_by=self.context["request"].user,
+            status=validated_data.pop("status", Campaign.Status.PENDING),
+            **validated_data,
+        )
+        campaign.save()
+
+        # bulk_create still uploads each file (FileField.pre_save) but inserts all rows in one query
+        media = [
+            CampaignMedia(campaign=campaign, media_type=_media_type(media_file), file=media_file, order=idx)
+            for idx, media_file in enumerate(media_files[:6])  # Limit to 6 files
+        ]
+        CampaignMedia.objects.bulk_create(media)
 
         return campaign
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         media_files = validated_data.pop("media_files", None)
 
@@ -260,25 +280,22 @@ class CampaignCreateSerializer(serializers.ModelSerializer):
         # If new media files provided, add them
         if media_files:
             existing_count = instance.media.count()
-            for idx, media_file in enumerate(media_files[:6]):  # Limit to 6 files total
-                if existing_count + idx >= 6:
-                    break
-                media_type = (
-                    "video"
-                    if hasattr(media_file, "content_type") and media_file.content_type.startswith("video/")
-                    else "image"
-                )
-                CampaignMedia.objects.create(
+            remaining = max(0, 6 - existing_count)  # Limit to 6 files total
+            media = [
+                CampaignMedia(
                     campaign=instance,
-                    media_type=media_type,
+                    media_type=_media_type(media_file),
                     file=media_file,
                     order=existing_count + idx,
                 )
+                for idx, media_file in enumerate(media_files[:remaining])
+            ]
+            CampaignMedia.objects.bulk_create(media)
 
         return instance
 
 
-class DonationSerializer(serializers.ModelSerializer):
+class DonationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     campaign = CampaignSerializer(read_only=True)
     campaign_id = serializers.IntegerField(write_only=True)
 
@@ -295,24 +312,31 @@ class DonationCreateSerializer(serializers.ModelSerializer):
         model = Donation
         fields = ["campaign_id", "amount"]
 
-    def validate_campaign_id(self, value):
+    def validate(self, attrs):
         try:
-            campaign = Campaign.objects.get(id=value, status="approved")
+            # The checkout view works from this instance, including the owner's Stripe account;
+            # the large text columns are never read on that path
+            campaign = (
+                Campaign.objects.select_related("created_by__stripe_account")
+                .defer("description", "moderation_notes")
+                .get(id=attrs["campaign_id"], status=Campaign.Status.APPROVED)
+            )
         except Campaign.DoesNotExist:
-            raise serializers.ValidationError("Campaign not found or not approved")
+            raise serializers.ValidationError({"campaign_id": "Campaign not found or not approved"})
         if not campaign.stripe_ready:
-            raise serializers.ValidationError("Campaign is not ready to accept donations")
-        return value
+            raise serializers.ValidationError({"campaign_id": "Campaign is not ready to accept donations"})
+        attrs["campaign"] = campaign
+        return attrs
 
 
-class NewsMediaSerializer(serializers.ModelSerializer):
+class NewsMediaSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = NewsMedia
         fields = ["id", "media_type", "file", "order"]
         read_only_fields = ["id"]
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     media = NewsMediaSerializer(many=True, read_only=True)
 
     class Meta:
@@ -337,21 +361,22 @@ class NewsCreateSerializer(serializers.ModelSerializer):
         model = News
         fields = ["title", "content", "published", "media_files"]
 
+    @transaction.atomic
     def create(self, validated_data):
         media_files = validated_data.pop("media_files", [])
+        # The article and its media rows commit together, so a failed upload leaves no orphan article
         news = News.objects.create(**validated_data)
 
-        # Add media files
-        for idx, media_file in enumerate(media_files[:6]):  # Limit to 6 files
-            media_type = (
-                "video"
-                if hasattr(media_file, "content_type") and media_file.content_type.startswith("video/")
-                else "image"
-            )
-            NewsMedia.objects.create(news=news, media_type=media_type, file=media_file, order=idx)
+        # bulk_create still uploads each file (FileField.pre_save) but inserts all rows in one query
+        media = [
+            NewsMedia(news=news, media_type=_media_type(media_file), file=media_file, order=idx)
+            for idx, media_file in enumerate(media_files[:6])  # Limit to 6 files
+        ]
+        NewsMedia.objects.bulk_create(media)
 
         return news
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         media_files = validated_data.pop("media_files", None)
 
@@ -363,19 +388,16 @@ class NewsCreateSerializer(serializers.ModelSerializer):
         # If new media files provided, add them
         if media_files:
             existing_count = instance.media.count()
-            for idx, media_file in enumerate(media_files[:6]):  # Limit to 6 files total
-                if existing_count + idx >= 6:
-                    break
-                media_type = (
-                    "video"
-                    if hasattr(media_file, "content_type") and media_file.content_type.startswith("video/")
-                    else "image"
-                )
-                NewsMedia.objects.create(
+            remaining = max(0, 6 - existing_count)  # Limit to 6 files total
+            media = [
+                NewsMedia(
                     news=instance,
-                    media_type=media_type,
+                    media_type=_media_type(media_file),
                     file=media_file,
                     order=existing_count + idx,
                 )
+                for idx, media_file in enumerate(media_files[:remaining])
+            ]
+            NewsMedia.objects.bulk_create(media)
 
         return instance
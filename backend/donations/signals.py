@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_token
+from .caching import invalidate_news
+from .models import News, NewsMedia
+
+
+@receiver(post_delete, sender=Token)
+def drop_cached_token(sender, instance, **kwargs):
+    invalidate_token(instance.key, user_id=instance.user_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def drop_cached_user_tokens(sender, instance, update_fields=None, **kwargs):
+    # get_token_user only reads the token cache when it is shared
+    if not getattr(settings, "SHARED_CACHE", False):
+        return
+    # A last_login stamp cannot change what authentication checks; cached copies just show the old value until expiry
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    # Cached users would otherwise keep a stale is_active/is_moderator until the entry expires
+    for token_key in Token.objects.filter(user_id=instance.pk).values_list("key", flat=True):
+        invalidate_token(token_key)
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+@receiver(post_save, sender=NewsMedia)
+@receiver(post_delete, sender=NewsMedia)
+def drop_cached_news(sender, instance, **kwargs):
+    # After commit, so a reader inside the write's window can't re-cache the old rows under the new generation;
+    # readers that started earlier store under the generation they read first (see NewsViewSet.list).
+    # Media added through bulk_create sends no signal, but always follows a News save in the same transaction.
+    transaction.on_commit(invalidate_news)
@@ -7,6 +7,10 @@ from django.conf import settings
 from django.urls import reverse
 from storages.backends.s3boto3 import S3Boto3Storage
 
+# BACKEND_URL should be set in environment (e.g., https://api.lend-a-hand.me).
+# Read once at import: url() runs for every media item of every serialized row.
+_BACKEND_URL = (getattr(settings, 'BACKEND_URL', None) or '').rstrip('/') or None
+
 
 class MinIOStorage(S3Boto3Storage):
     """
@@ -31,20 +35,12 @@ class MinIOStorage(S3Boto3Storage):
 
         Django will proxy this to MinIO and serve the file.
         """
-        # Get backend base URL from settings
-        # BACKEND_URL should be set in environment (e.g., https://api.lend-a-hand.me)
-        backend_url = getattr(settings, 'BACKEND_URL', None)
-
         # Remove any leading slashes from name to avoid double slashes
         clean_name = name.lstrip("/")
 
-        if backend_url:
+        if _BACKEND_URL:
             # Return absolute URL for production/deployment
-            # Remove trailing slash from backend_url if present
-            backend_url = backend_url.rstrip('/')
-            media_url = f"{backend_url}/api/media/{clean_name}"
-        else:
-            # Fallback to relative URL for local development
-            media_url = f"/api/media/{clean_name}"
-
-        return media_url
+            return f"{_BACKEND_URL}/api/media/{clean_name}"
+
+        # Fallback to relative URL for local development
+        return f"/api/media/{clean_name}"
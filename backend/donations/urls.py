@@ -16,7 +16,9 @@ from .views import (
     stripe_webhook,
 )
 
+# No client requests .json/.api suffixes; skipping them halves the router patterns each request is matched against
 router = DefaultRouter()
+router.include_format_suffixes = False
 router.register(r"users", UserViewSet, basename="user")
 router.register(r"campaigns", CampaignViewSet, basename="campaign")
 router.register(r"donations", DonationViewSet, basename="donation")
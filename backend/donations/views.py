@@ -1,26 +1,33 @@
+import json
 import logging
 from datetime import datetime
 from datetime import timezone as dt_timezone
+from decimal import Decimal
 
 import stripe
 from django.conf import settings
 from django.contrib.auth import logout
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import DecimalField, F, OuterRef, Prefetch, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.response import Response
 
 logger = logging.getLogger(__name__)
 
-from .models import Campaign, Donation, News, User, UserStripeAccount
+from .authentication import get_user_token_key
+from .caching import get_news_list, news_generation, set_news_list
+from .models import Campaign, Donation, ModerationHistory, News, User, UserStripeAccount
 from .serializers import (
     CampaignCreateSerializer,
     CampaignSerializer,
+    CampaignWithHistorySerializer,
     DonationCreateSerializer,
     DonationSerializer,
     LoginSerializer,
@@ -34,6 +41,12 @@ from .serializers import (
 )
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
+# Gunicorn runs sync workers, so a hung Stripe call blocks the worker until this timeout
+stripe.default_http_client = stripe.http_client.RequestsClient(timeout=getattr(settings, "STRIPE_TIMEOUT", 20))
+
+# Large enough that a typical campaign image streams in a handful of writes
+MEDIA_STREAM_CHUNK_SIZE = 64 * 1024
+MEDIA_CACHE_CONTROL = "public, max-age=86400"  # Cache for 1 day
 
 
 def get_user_stripe_account(user):
@@ -43,6 +56,58 @@ def get_user_stripe_account(user):
         return None
 
 
+def increment_campaign_amount(campaign_id, amount):
+    """Add ``amount`` to a campaign's total in SQL, so concurrent confirmations cannot lose an update."""
+    # update() bypasses auto_now, so stamp updated_at as save() would have
+    Campaign.objects.filter(pk=campaign_id).update(
+        current_amount=F("current_amount") + amount, updated_at=timezone.now()
+    )
+
+
+def resync_campaign_amount(campaign_id):
+    """
+    Reset a campaign's total to the sum of its donations in one UPDATE; returns 1 if it had drifted.
+
+    Only current_amount and updated_at are written, so concurrent increments and status changes survive.
+    """
+    total = Coalesce(
+        Subquery(
+            Donation.objects.filter(campaign_id=OuterRef("pk"))
+            .values("campaign_id")
+            .annotate(total=Sum("amount"))
+            .values("total")
+        ),
+        Value(Decimal("0")),
+        output_field=DecimalField(max_digits=10, decimal_places=2),
+    )
+    return (
+        Campaign.objects.filter(pk=campaign_id)
+        .exclude(current_amount=total)
+        .update(current_amount=total, updated_at=timezone.now())
+    )
+
+
+def record_donation(campaign_id, amount, payment_intent):
+    """
+    Create the anonymous donation for a paid checkout session and add it to the campaign total.
+
+    Stripe retries webhooks and the success page confirms the same session, so the payment
+    intent (unique when set) keys the insert: replays return the existing donation with
+    created=False and leave the total untouched.
+    """
+    defaults = {"campaign_id": campaign_id, "amount": amount, "donor_name": "", "donor_email": "", "is_anonymous": True}
+    with transaction.atomic():
+        if payment_intent:
+            donation, created = Donation.objects.get_or_create(
+                stripe_payment_intent_id=payment_intent, defaults=defaults
+            )
+        else:
+            donation, created = Donation.objects.create(stripe_payment_intent_id="", **defaults), True
+        if created:
+            increment_campaign_amount(campaign_id, amount)
+    return donation, created
+
+
 def create_stripe_account_for_user(user):
     """Create a new Stripe Express account for the given user."""
     account = stripe.Account.create(
@@ -87,10 +152,6 @@ def sync_user_stripe_account(user_account):
     """Refresh Stripe account status from Stripe API."""
     stripe_account = stripe.Account.retrieve(user_account.stripe_account_id)
     user_account.update_from_stripe_account(stripe_account)
-    if user_account.is_ready and (user_account.onboarding_url or user_account.onboarding_expires_at):
-        user_account.onboarding_url = ""
-        user_account.onboarding_expires_at = None
-        user_account.save(update_fields=["onboarding_url", "onboarding_expires_at", "updated_at"])
     return user_account
 
 
@@ -104,9 +165,12 @@ class UserViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
+        # UserSerializer reports each user's Stripe status, so join the account in the same query.
+        # Password hashes are never rendered; saves on a deferred instance leave them untouched.
+        queryset = User.objects.select_related("stripe_account").defer("password")
         if self.request.user.is_moderator or self.request.user.is_staff:
-            return User.objects.all().order_by("-date_joined")
-        return User.objects.filter(id=self.request.user.id)
+            return queryset.order_by("-date_joined")
+        return queryset.filter(id=self.request.user.id)
 
     @action(detail=False, methods=["get"])
     def me(self, request):
@@ -142,7 +206,7 @@ class UserViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
             request.user.set_password(serializer.validated_data["new_password"])
-            request.user.save()
+            request.user.save(update_fields=["password"])
             return Response({"status": "password changed"})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -260,7 +324,8 @@ def register(request):
     serializer = UserRegistrationSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.save()
-        token, created = Token.objects.get_or_create(user=user)
+        # A freshly registered user cannot have a token yet, so skip get_or_create's lookup
+        token = Token.objects.create(user=user)
         return Response(
             {"token": token.key, "user": UserSerializer(user).data},
             status=status.HTTP_201_CREATED,
@@ -276,8 +341,7 @@ def login_view(request):
     if serializer.is_valid():
         user = serializer.validated_data["user"]
         # Only create/get token, don't use session login for API
-        token, created = Token.objects.get_or_create(user=user)
-        return Response({"token": token.key, "user": UserSerializer(user).data})
+        return Response({"token": get_user_token_key(user), "user": UserSerializer(user).data})
     # Return a more consistent error format
     errors = serializer.errors
     error_msg = None
@@ -317,11 +381,11 @@ def login_view(request):
 @permission_classes([permissions.IsAuthenticated])
 def logout_view(request):
     """User logout endpoint."""
+    # logout() swaps request.user for AnonymousUser, so keep a handle on the real user first
+    user = request.user
     logout(request)
-    try:
-        request.user.auth_token.delete()
-    except Exception:
-        pass
+    # A user without a token simply deletes nothing
+    Token.objects.filter(user=user).delete()
     return Response({"status": "logged out"})
 
 
@@ -433,7 +497,7 @@ def password_reset_confirm(request):
 
     # Set new password
     user.set_password(new_password)
-    user.save()
+    user.save(update_fields=["password"])
 
     logger.info(f"Password reset successful for user {user.email}")
 
@@ -450,17 +514,13 @@ class CampaignViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action == "create" or self.action == "update":
             return CampaignCreateSerializer
+        if self._include_history():
+            return CampaignWithHistorySerializer
         return CampaignSerializer
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        include_history = (
-            self.request.query_params.get("include_history", "").lower() == "true"
-            if hasattr(self.request, "query_params")
-            else False
-        )
-        context["include_history"] = include_history
-        return context
+    def _include_history(self):
+        query_params = getattr(self.request, "query_params", None)
+        return query_params is not None and query_params.get("include_history", "").lower() == "true"
 
     def get_queryset(self):
         queryset = Campaign.objects.all()
@@ -468,18 +528,27 @@ class CampaignViewSet(viewsets.ModelViewSet):
 
         # Public can only see approved campaigns
         if not self.request.user.is_authenticated:
-            queryset = queryset.filter(status="approved", stripe_ready=True)
+            queryset = queryset.filter(status=Campaign.Status.APPROVED, stripe_ready=True)
         elif not (self.request.user.is_moderator or self.request.user.is_staff):
             # Regular users see approved, Stripe-ready campaigns plus their own
-            queryset = queryset.filter(Q(status="approved", stripe_ready=True) | Q(created_by=self.request.user))
+            queryset = queryset.filter(
+                Q(status=Campaign.Status.APPROVED, stripe_ready=True) | Q(created_by=self.request.user)
+            )
 
         if status_filter:
             queryset = queryset.filter(status=status_filter)
 
-        queryset = queryset.select_related("created_by").prefetch_related("media", "donations")
+        # CampaignSerializer never renders donations, so they are not prefetched
+        queryset = queryset.select_related("created_by__stripe_account").prefetch_related("media")
 
-        if self.request.query_params.get("include_history", "").lower() == "true":
-            queryset = queryset.prefetch_related("moderation_history__moderator")
+        if self._include_history():
+            # History entries nest the moderator through UserSerializer, which reads the Stripe account
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "moderation_history",
+                    queryset=ModerationHistory.objects.select_related("moderator__stripe_account"),
+                )
+            )
 
         return queryset
 
@@ -514,8 +583,8 @@ class CampaignViewSet(viewsets.ModelViewSet):
         campaign.stripe_ready = stripe_account.is_ready
 
         update_fields = ["stripe_ready", "updated_at"]
-        if not stripe_account.is_ready and campaign.status != "draft":
-            campaign.status = "draft"
+        if not stripe_account.is_ready and campaign.status != Campaign.Status.DRAFT:
+            campaign.status = Campaign.Status.DRAFT
             update_fields.append("status")
 
         campaign.save(update_fields=update_fields)
@@ -528,33 +597,47 @@ class CampaignViewSet(viewsets.ModelViewSet):
         ):
             raise PermissionDenied("You can only edit your own campaigns.")
         new_status = serializer.validated_data.get("status", instance.status)
-        if new_status in ["pending", "approved"] and not instance.stripe_ready:
+        if new_status in [Campaign.Status.PENDING, Campaign.Status.APPROVED] and not instance.stripe_ready:
             raise ValidationError(
                 {"status": "Complete Stripe onboarding before submitting this campaign for moderation."}
             )
         # Reset moderation when editing approved/rejected campaigns
-        if instance.status in ["approved", "rejected"]:
-            serializer.save(status="pending", moderation_notes="")
+        if instance.status in [Campaign.Status.APPROVED, Campaign.Status.REJECTED]:
+            serializer.save(status=Campaign.Status.PENDING, moderation_notes="")
         else:
             serializer.save()
 
+    def _set_status(self, pk, new_status, allow_moderators):
+        """
+        Set a visible campaign's status with a single UPDATE, folding the ownership check into the WHERE clause.
+
+        Returns an error response when no row matched, or None on success.
+        """
+        try:
+            campaigns = self.get_queryset().filter(pk=pk)
+        except (TypeError, ValueError):
+            # A non-numeric pk is a missing campaign, as it would be through get_object()
+            raise NotFound
+        user = self.request.user
+        authorized = campaigns
+        if not (allow_moderators and (user.is_moderator or user.is_staff)):
+            authorized = campaigns.filter(created_by=user)
+        # update() bypasses auto_now, so stamp updated_at as save() would have
+        if authorized.update(status=new_status, updated_at=timezone.now()):
+            return None
+        if campaigns.exists():
+            return Response({"error": "Not authorized"}, status=status.HTTP_403_FORBIDDEN)
+        raise NotFound
+
     @action(detail=True, methods=["post"])
     def suspend(self, request, pk=None):
-        campaign = self.get_object()
-        if campaign.created_by != request.user and not (request.user.is_moderator or request.user.is_staff):
-            return Response({"error": "Not authorized"}, status=status.HTTP_403_FORBIDDEN)
-        campaign.status = "suspended"
-        campaign.save()
-        return Response({"status": "campaign suspended"})
+        error_response = self._set_status(pk, Campaign.Status.SUSPENDED, allow_moderators=True)
+        return error_response or Response({"status": "campaign suspended"})
 
     @action(detail=True, methods=["post"])
     def cancel(self, request, pk=None):
-        campaign = self.get_object()
-        if campaign.created_by != request.user:
-            return Response({"error": "Not authorized"}, status=status.HTTP_403_FORBIDDEN)
-        campaign.status = "cancelled"
-        campaign.save()
-        return Response({"status": "campaign cancelled"})
+        error_response = self._set_status(pk, Campaign.Status.CANCELLED, allow_moderators=False)
+        return error_response or Response({"status": "campaign cancelled"})
 
     @action(detail=True, methods=["post"])
     def resume(self, request, pk=None):
@@ -563,7 +646,7 @@ class CampaignViewSet(viewsets.ModelViewSet):
 
         campaign = self.get_object()
 
-        if campaign.status not in ["suspended", "cancelled"]:
+        if campaign.status not in [Campaign.Status.SUSPENDED, Campaign.Status.CANCELLED]:
             return Response(
                 {"error": "Campaign is not suspended or cancelled."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -576,21 +659,21 @@ class CampaignViewSet(viewsets.ModelViewSet):
             )
 
         moderation_notes = request.data.get("moderation_notes")
-        campaign.status = "approved"
+        campaign.status = Campaign.Status.APPROVED
         update_fields = ["status", "updated_at"]
         if moderation_notes is not None:
             campaign.moderation_notes = moderation_notes
             update_fields.append("moderation_notes")
-        campaign.save(update_fields=update_fields)
 
-        from .models import ModerationHistory
-
-        ModerationHistory.objects.create(
-            campaign=campaign,
-            moderator=request.user,
-            action="resume",
-            notes=moderation_notes if moderation_notes is not None else campaign.moderation_notes,
-        )
+        # The status change and its history entry commit together
+        with transaction.atomic():
+            campaign.save(update_fields=update_fields)
+            ModerationHistory.objects.create(
+                campaign=campaign,
+                moderator=request.user,
+                action="resume",
+                notes=moderation_notes if moderation_notes is not None else campaign.moderation_notes,
+            )
 
         return Response(
             {
@@ -611,26 +694,25 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 {"error": "Campaign cannot be approved until Stripe onboarding is complete."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if campaign.status != "pending":
+        if campaign.status != Campaign.Status.PENDING:
             return Response(
                 {"error": "Campaign is not pending moderation."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         moderation_notes = request.data.get("moderation_notes", "")
-        campaign.status = "approved"
+        campaign.status = Campaign.Status.APPROVED
         campaign.moderation_notes = moderation_notes
-        campaign.save()
 
-        # Create moderation history
-        from .models import ModerationHistory
-
-        ModerationHistory.objects.create(
-            campaign=campaign,
-            moderator=request.user,
-            action="approve",
-            notes=moderation_notes,
-        )
+        # The status change and its history entry commit together
+        with transaction.atomic():
+            campaign.save(update_fields=["status", "moderation_notes", "updated_at"])
+            ModerationHistory.objects.create(
+                campaign=campaign,
+                moderator=request.user,
+                action="approve",
+                notes=moderation_notes,
+            )
 
         return Response(
             {
@@ -646,7 +728,7 @@ class CampaignViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Only moderators and staff can reject campaigns.")
 
         campaign = self.get_object()
-        if campaign.status != "pending":
+        if campaign.status != Campaign.Status.PENDING:
             return Response(
                 {"error": "Campaign is not pending moderation."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -659,19 +741,18 @@ class CampaignViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        campaign.status = "rejected"
+        campaign.status = Campaign.Status.REJECTED
         campaign.moderation_notes = moderation_notes
-        campaign.save()
-
-        # Create moderation history
-        from .models import ModerationHistory
 
-        ModerationHistory.objects.create(
-            campaign=campaign,
-            moderator=request.user,
-            action="reject",
-            notes=moderation_notes,
-        )
+        # The status change and its history entry commit together
+        with transaction.atomic():
+            campaign.save(update_fields=["status", "moderation_notes", "updated_at"])
+            ModerationHistory.objects.create(
+                campaign=campaign,
+                moderator=request.user,
+                action="reject",
+                notes=moderation_notes,
+            )
 
         return Response(
             {
@@ -687,7 +768,13 @@ class DonationViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
-        queryset = Donation.objects.select_related("campaign")
+        # DonationSerializer nests the full campaign, including its owner and media, but of the
+        # donation itself only renders these columns
+        queryset = (
+            Donation.objects.select_related("campaign__created_by__stripe_account")
+            .prefetch_related("campaign__media")
+            .only("id", "amount", "created_at", "campaign")
+        )
         campaign_id = self.request.query_params.get("campaign", None)
         if campaign_id:
             queryset = queryset.filter(campaign_id=campaign_id)
@@ -722,11 +809,7 @@ class DonationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            campaign = Campaign.objects.get(id=campaign_id, status="approved")
-        except Campaign.DoesNotExist:
-            return Response({"error": "Campaign not found or not approved"}, status=status.HTTP_404_NOT_FOUND)
-
+        campaign = serializer.validated_data["campaign"]
         user_account = get_user_stripe_account(campaign.created_by)
         if not user_account:
             logger.error("Campaign %s has no associated Stripe account via creator", campaign.id)
@@ -792,11 +875,6 @@ class DonationViewSet(viewsets.ModelViewSet):
             return Response({"session_id": checkout_session.id, "url": checkout_session.url})
         except stripe.error.StripeError as e:
             return Response({"error": f"Stripe error: {str(e)}"}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            import traceback
-
-            logger.error(f"Error creating checkout session: {traceback.format_exc()}")
-            return Response({"error": f"An error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @swagger_auto_schema(
         request_body=openapi.Schema(
@@ -822,38 +900,19 @@ class DonationViewSet(viewsets.ModelViewSet):
                 amount = session.amount_total / 100  # Convert from cents
                 payment_intent = session.payment_intent
 
-                from decimal import Decimal
-
                 campaign = Campaign.objects.get(id=campaign_id)
 
-                # Check if donation already exists (prevent duplicates)
-                if payment_intent and Donation.objects.filter(stripe_payment_intent_id=payment_intent).exists():
+                donation, created = record_donation(campaign_id, Decimal(str(amount)), payment_intent)
+                if not created:
                     logger.info(f"Donation already exists for payment_intent {payment_intent}")
-                    # Return existing donation, but ensure campaign amount is updated
-                    existing_donation = Donation.objects.get(stripe_payment_intent_id=payment_intent)
-                    # Update campaign amount if it doesn't reflect this donation
-                    # Recalculate from all donations to ensure consistency
-                    all_donations = Donation.objects.filter(campaign=campaign)
-                    total_donated = sum(Decimal(str(d.amount)) for d in all_donations)
-                    if campaign.current_amount != total_donated:
-                        campaign.current_amount = total_donated
-                        campaign.save()
-                        logger.info(f"Updated campaign {campaign_id} current_amount to {total_donated}")
-                    return Response({"status": "success", "donation": DonationSerializer(existing_donation).data})
-
-                # Create donation record (all donations are anonymous)
-                donation = Donation.objects.create(
-                    campaign=campaign,
-                    amount=Decimal(str(amount)),
-                    donor_name="",
-                    donor_email="",
-                    is_anonymous=True,
-                    stripe_payment_intent_id=payment_intent,
-                )
-
-                # Update campaign amount
-                campaign.current_amount = (campaign.current_amount or Decimal("0")) + Decimal(str(amount))
-                campaign.save()
+                    # Return the existing donation, but make sure the campaign total reflects it
+                    if resync_campaign_amount(campaign_id):
+                        logger.info(f"Resynced campaign {campaign_id} current_amount with its donations")
+                    return Response({"status": "success", "donation": DonationSerializer(donation).data})
+
+                # The response nests the campaign, so pick up the total the database computed
+                campaign.refresh_from_db(fields=["current_amount", "updated_at"])
+                donation.campaign = campaign
                 logger.info(f"Updated campaign {campaign_id} current_amount by {amount}")
 
                 return Response({"status": "success", "donation": DonationSerializer(donation).data})
@@ -862,8 +921,14 @@ class DonationViewSet(viewsets.ModelViewSet):
                     {"error": "Payment not completed"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except stripe.error.StripeError as e:
+            return Response({"error": f"Stripe error: {str(e)}"}, status=status.HTTP_400_BAD_REQUEST)
+        except Campaign.DoesNotExist:
+            return Response({"error": "Campaign not found"}, status=status.HTTP_404_NOT_FOUND)
+        except (KeyError, TypeError, ValueError):
+            return Response(
+                {"error": "Checkout session is missing donation details"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
 
 class NewsViewSet(viewsets.ModelViewSet):
@@ -876,7 +941,8 @@ class NewsViewSet(viewsets.ModelViewSet):
         return NewsSerializer
 
     def get_queryset(self):
-        queryset = News.objects.all()
+        # NewsSerializer nests media, so load it for the whole page in one extra query
+        queryset = News.objects.prefetch_related("media")
         # Public users can only see published news
         if not self.request.user.is_authenticated:
             queryset = queryset.filter(published=True)
@@ -885,6 +951,27 @@ class NewsViewSet(viewsets.ModelViewSet):
         # Moderators/staff can see all news (including unpublished)
         return queryset.order_by("-created_at")
 
+    def list(self, request, *args, **kwargs):
+        # Without a shared cache an edit would only invalidate the worker that handled it
+        if not getattr(settings, "SHARED_CACHE", False):
+            return super().list(request, *args, **kwargs)
+        if request.user.is_authenticated and (request.user.is_moderator or request.user.is_staff):
+            return super().list(request, *args, **kwargs)
+
+        # Everyone else gets the same published pages, so serve those from the cache
+        page_param = self.paginator.page_query_param
+        host = request.get_host()
+        page = request.query_params.get(page_param, "1")
+        # Read once: rows loaded before an edit commits must not be stored under the generation it installs
+        generation = news_generation()
+        data = get_news_list(generation, host, page)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            # Pagination links echo the query string, so only store pages requested without extra parameters
+            if set(request.query_params) <= {page_param}:
+                set_news_list(generation, host, page, data)
+        return Response(data)
+
     def perform_create(self, serializer):
         # Only moderators and staff can create news
         if not (self.request.user.is_moderator or self.request.user.is_staff):
@@ -912,18 +999,23 @@ def stripe_webhook(request):
     sig_header = request.META.get("HTTP_STRIPE_SIGNATURE")
     endpoint_secret = getattr(settings, "STRIPE_WEBHOOK_SECRET", None)
 
-    if not endpoint_secret:
-        # In development, skip signature verification
-        import json
-
-        event = json.loads(payload)
-    else:
+    if endpoint_secret:
+        # Same check as Webhook.construct_event, minus wrapping the whole payload in StripeObjects;
+        # the handlers below only index into plain dicts
         try:
-            event = stripe.Webhook.construct_event(payload, sig_header, endpoint_secret)
+            stripe.WebhookSignature.verify_header(
+                payload.decode("utf-8"), sig_header, endpoint_secret, stripe.Webhook.DEFAULT_TOLERANCE
+            )
         except ValueError:
             return Response({"error": "Invalid payload"}, status=400)
         except stripe.error.SignatureVerificationError:
             return Response({"error": "Invalid signature"}, status=400)
+    # In development (no secret), signature verification is skipped
+
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        return Response({"error": "Invalid payload"}, status=400)
 
     if event["type"] == "checkout.session.completed":
         session = event["data"]["object"]
@@ -934,33 +1026,16 @@ def stripe_webhook(request):
             amount = session["amount_total"] / 100
             payment_intent = session.get("payment_intent", "")
 
-            # Check if donation already exists (prevent duplicates)
-            if payment_intent and Donation.objects.filter(stripe_payment_intent_id=payment_intent).exists():
+            _, created = record_donation(campaign_id, Decimal(str(amount)), payment_intent)
+            if not created:
                 logger.info(f"Donation already exists for payment_intent {payment_intent}")
                 return Response({"status": "already_processed"}, status=200)
-
-            campaign = Campaign.objects.get(id=campaign_id)
-
-            from decimal import Decimal
-
-            # Create donation record (all donations are anonymous)
-            Donation.objects.create(
-                campaign=campaign,
-                amount=Decimal(str(amount)),
-                donor_name="",
-                donor_email="",
-                is_anonymous=True,
-                stripe_payment_intent_id=payment_intent,
-            )
-
-            # Update campaign amount
-            campaign.current_amount = (campaign.current_amount or Decimal("0")) + Decimal(str(amount))
-            campaign.save()
             logger.info(f"Webhook: Donation for campaign {campaign_id} confirmed. Updated amount by {amount}")
 
-        except Exception as e:
+        except (KeyError, TypeError, ValueError) as e:
+            # Malformed session data is the sender's problem; database errors reach the exception handler as 500s
             logger.error(f"Webhook error processing checkout.session.completed: {e}")
-            return Response({"error": str(e)}, status=500)
+            return Response({"error": "Invalid checkout session"}, status=400)
     elif event["type"] == "account.updated":
         account_data = event["data"]["object"]
         account_id = account_data.get("id")
@@ -1035,30 +1110,40 @@ def serve_media(request, file_path):
     URL format: /api/media/<file_path>
     Example: /api/media/campaigns/image.jpg
     """
-    import boto3
     from botocore.exceptions import ClientError
+    from django.apps import apps
     from django.conf import settings
-    from django.http import Http404, StreamingHttpResponse
+    from django.http import Http404, HttpResponseNotModified, StreamingHttpResponse
 
     # Only serve media if S3 storage is enabled
     if not settings.USE_S3_STORAGE:
         raise Http404("Media storage not configured")
 
     try:
-        # Connect to MinIO
-        s3_client = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+        # Reuse the app-wide MinIO client and its connection pool
+        s3_client = apps.get_app_config("donations").get_s3_client()
 
         bucket_name = settings.AWS_STORAGE_BUCKET_NAME
 
+        get_kwargs = {"Bucket": bucket_name, "Key": file_path}
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match:
+            # MinIO compares against the stored ETag and answers 304 without sending the body
+            get_kwargs["IfNoneMatch"] = if_none_match
+
         # Get object from MinIO
         try:
-            obj = s3_client.get_object(Bucket=bucket_name, Key=file_path)
+            obj = s3_client.get_object(**get_kwargs)
         except ClientError as e:
+            response_metadata = e.response.get("ResponseMetadata", {})
+            if response_metadata.get("HTTPStatusCode") == 304:
+                response = HttpResponseNotModified()
+                # The client's header may be a list or "*", so only repeat the ETag MinIO reported
+                etag = response_metadata.get("HTTPHeaders", {}).get("etag")
+                if etag:
+                    response["ETag"] = etag
+                response["Cache-Control"] = MEDIA_CACHE_CONTROL
+                return response
             error_code = e.response.get("Error", {}).get("Code", "")
             if error_code == "NoSuchKey":
                 raise Http404("File not found")
@@ -1068,16 +1153,15 @@ def serve_media(request, file_path):
         # Determine content type
         content_type = obj.get("ContentType", "application/octet-stream")
 
-        # Stream the file content
-        def file_iterator():
-            for chunk in obj["Body"].iter_chunks(chunk_size=8192):
-                yield chunk
-
-        # Create streaming response
-        response = StreamingHttpResponse(file_iterator(), content_type=content_type)
+        # Stream the object body straight through without buffering it in memory
+        response = StreamingHttpResponse(
+            obj["Body"].iter_chunks(chunk_size=MEDIA_STREAM_CHUNK_SIZE), content_type=content_type
+        )
 
         # Set cache headers
-        response["Cache-Control"] = "public, max-age=86400"  # Cache for 1 day
+        response["Cache-Control"] = MEDIA_CACHE_CONTROL
+        if obj.get("ETag"):
+            response["ETag"] = obj["ETag"]
 
         # Set content length if available
         if "ContentLength" in obj:
@@ -52,8 +52,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "donations.middleware.DisableCSRFForAPI",  # Exempt API from CSRF
+    "donations.middleware.APICsrfViewMiddleware",  # CsrfViewMiddleware that exempts /api/
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "donations.middleware.TokenAuthenticationMiddleware",  # Token auth for template views
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -101,6 +100,37 @@ if os.getenv("DATABASE_URL"):
     except ImportError:
         pass
 
+# Cache
+# Shared Redis cache when REDIS_URL is set (so invalidation reaches every worker), per-process memory otherwise
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Caches whose invalidation must reach every worker (tokens, news pages) are only used when the
+# backend is shared; with per-process memory those lookups go to the database instead
+SHARED_CACHE = bool(os.getenv("REDIS_URL"))
+
+# Seconds a token -> user lookup stays cached; logout and user changes invalidate it earlier
+TOKEN_CACHE_TIMEOUT = int(os.getenv("TOKEN_CACHE_TIMEOUT", "60"))
+
+# Seconds a page of the public news list stays cached; news edits invalidate it earlier
+NEWS_CACHE_TIMEOUT = int(os.getenv("NEWS_CACHE_TIMEOUT", "120"))
+
+# Failed logins per email before password checks are refused until the window (seconds) expires.
+# Counted per worker unless SHARED_CACHE is set, so the limit is then only approximate.
+LOGIN_FAILURE_LIMIT = int(os.getenv("LOGIN_FAILURE_LIMIT", "5"))
+LOGIN_FAILURE_TIMEOUT = int(os.getenv("LOGIN_FAILURE_TIMEOUT", "900"))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -200,6 +230,9 @@ else:
         # Allow during database setup operations (no media storage needed)
         MEDIA_URL = f"{os.getenv('AWS_S3_ENDPOINT_URL', 'http://localhost:9000')}/{os.getenv('AWS_STORAGE_BUCKET_NAME', 'lend-a-hand-media')}/"
 
+# Startup diagnostics (database, MinIO, Stripe, frontend reachability), logged from a background thread
+RUN_STARTUP_CHECKS = os.getenv("RUN_STARTUP_CHECKS", "True") == "True"
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -209,7 +242,7 @@ AUTH_USER_MODEL = "donations.User"
 # REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "donations.authentication.CachedTokenAuthentication",
         # SessionAuthentication removed to avoid CSRF issues with API endpoints
         # 'rest_framework.authentication.SessionAuthentication',
     ],
@@ -290,6 +323,8 @@ STRIPE_ONBOARDING_RETURN_URL = os.getenv(
 STRIPE_ONBOARDING_REFRESH_URL = os.getenv(
     "STRIPE_ONBOARDING_REFRESH_URL", f"{FRONTEND_URL}/dashboard?stripe_onboarding=refresh"
 )
+# Seconds a single Stripe API call may hold a worker (stripe-python defaults to 80)
+STRIPE_TIMEOUT = int(os.getenv("STRIPE_TIMEOUT", "20"))
 
 # Parler (Localization)
 PARLER_LANGUAGES = {
@@ -25,6 +25,8 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -35,6 +37,11 @@ BASE_DIR = SCRIPT_DIR.parent
 SEEDDATA_DIR = SCRIPT_DIR
 IMAGES_DIR = SEEDDATA_DIR / "images"
 
+# Accounts created by setup-db.sh rather than through the API
+SETUP_DB_EMAILS = frozenset({"admin@lend-a-hand.me", "moderator@lend-a-hand.me"})
+USER_SETUP_WORKERS = 8
+IMAGE_READ_WORKERS = 8
+
 
 class SeederAPI:
     """Client for seeding data via REST API."""
@@ -104,6 +111,25 @@ class SeederAPI:
             print(f"✗ Registration failed: {response.status_code} - {response.text}")
             return False
 
+    def list_news_titles(self):
+        """Return the titles of all existing news articles, following pagination."""
+        titles = set()
+        url = f"{self.base_url}/news/"
+        while url:
+            response = self.session.get(url)
+            if response.status_code != 200:
+                print(f"  ⚠ Unable to list existing news: {response.status_code} - {response.text}")
+                break
+            data = response.json()
+            if isinstance(data, dict):
+                results = data.get("results", [])
+                url = data.get("next")
+            else:
+                results = data
+                url = None
+            titles.update(article["title"] for article in results)
+        return titles
+
     def create_news(self, news_data, image_files=None):
         """Create a news article via API."""
         url = f"{self.base_url}/news/"
@@ -119,13 +145,10 @@ class SeederAPI:
         if image_files:
             for img_file in image_files:
                 if img_file.exists():
-                    files.append(("media_files", (img_file.name, open(img_file, "rb"), "image/jpeg")))
+                    files.append(("media_files", (img_file.name, load_image_bytes(img_file), "image/jpeg")))
 
         if files:
             response = self.session.post(url, data=data, files=files)
-            # Close file handles
-            for _, (_, file_handle, _) in files:
-                file_handle.close()
         else:
             response = self.session.post(url, json=data)
 
@@ -138,6 +161,41 @@ class SeederAPI:
             return None
 
 
+@lru_cache(maxsize=None)
+def load_image_bytes(image_path):
+    """Read an image file once; articles that share an image reuse the cached bytes."""
+    return image_path.read_bytes()
+
+
+def setup_user(api_base_url, user_data):
+    """Register a seed user, or log in if it already exists. Returns its API client, or None on failure."""
+    email = user_data["email"]
+    password = user_data["password"]
+    username = user_data["username"]
+
+    # Create API client for this user
+    user_api = SeederAPI(api_base_url)
+
+    print(f"  Creating user: {email}...")
+    registered = user_api.register_user(email, password, username)
+
+    # If registration failed, try to login (user might already exist)
+    if not registered:
+        # A failed registration leaves no token behind, so the same keep-alive session is reused
+        print(f"  Attempting to login as {email}...")
+        if user_api.login(email, password):
+            # Login successful - user exists with correct password
+            print(f"  ✓ Logged in as existing user: {email}")
+        else:
+            print(f"  ✗ Failed to setup user: {email}")
+            print(f"     Registration failed and login with password '{password}' also failed")
+            print(f"     User may exist with different password. Delete user manually or reset password.")
+            return None
+
+    print(f"  ✓ User {email} ready")
+    return user_api
+
+
 def load_json_file(filepath):
     """Load JSON data from file."""
     try:
@@ -168,8 +226,7 @@ def seed_data(api_base_url):
         return False
 
     # Filter out admin and moderator (created by setup-db.sh)
-    admin_emails = ["admin@lend-a-hand.me", "moderator@lend-a-hand.me"]
-    regular_users_data = [u for u in users_data if u["email"] not in admin_emails]
+    regular_users_data = [u for u in users_data if u["email"] not in SETUP_DB_EMAILS]
 
     # Store user APIs and metadata
     user_apis = {}
@@ -194,40 +251,21 @@ def seed_data(api_base_url):
     print()
 
     print(f"Step 3: Creating {len(regular_users_data)} regular users via API...")
-    for user_data in regular_users_data:
-        email = user_data["email"]
-        password = user_data["password"]
-        username = user_data["username"]
-
-        # Create API client for this user
-        user_api = SeederAPI(api_base_url)
-
-        print(f"  Creating user: {email}...")
-        registered = user_api.register_user(email, password, username)
-
-        # If registration failed, try to login (user might already exist)
-        if not registered:
-            # Create a fresh session for login attempt
-            login_api = SeederAPI(api_base_url)
-            print(f"  Attempting to login as {email}...")
-            if login_api.login(email, password):
-                # Login successful - user exists with correct password
-                user_api = login_api
-                print(f"  ✓ Logged in as existing user: {email}")
-            else:
-                print(f"  ✗ Failed to setup user: {email}")
-                print(f"     Registration failed and login with password '{password}' also failed")
-                print(f"     User may exist with different password. Delete user manually or reset password.")
-                continue
+    # Each user is an independent register/login round-trip, so they run concurrently;
+    # map() keeps the results in users.json order
+    with ThreadPoolExecutor(max_workers=USER_SETUP_WORKERS) as executor:
+        results = list(executor.map(lambda user_data: setup_user(api_base_url, user_data), regular_users_data))
+
+    for user_data, user_api in zip(regular_users_data, results):
+        if user_api is None:
+            continue
 
         # Store the API client
-        user_apis[email] = user_api
+        user_apis[user_data["email"]] = user_api
 
         # Track users for news creation
         if user_data.get("creates_news", False):
             users_for_news.append(user_api)
-
-        print(f"  ✓ User {email} ready")
     print()
 
     # Step 4: Create news (requires moderator/admin created by setup-db.sh)
@@ -240,17 +278,33 @@ def seed_data(api_base_url):
         else:
             # Use first available user who can create news (typically admin)
             news_api = users_for_news[0]
+            # One listing up front instead of a lookup per article keeps re-runs idempotent
+            existing_titles = news_api.list_news_titles()
+            # One directory listing instead of a stat() per referenced image
+            available_images = set(os.listdir(IMAGES_DIR)) if IMAGES_DIR.is_dir() else set()
+            pending_articles = []
             for article_data in news_data:
+                if article_data["title"] in existing_titles:
+                    print(f"  ℹ News already exists: {article_data['title']}")
+                    continue
+
                 # Get image files
                 image_files = []
                 if "images" in article_data:
                     for img_name in article_data["images"]:
-                        img_path = IMAGES_DIR / img_name
-                        if img_path.exists():
-                            image_files.append(img_path)
+                        if img_name in available_images:
+                            image_files.append(IMAGES_DIR / img_name)
                         else:
                             print(f"  ⚠ Image not found: {img_name}")
+                pending_articles.append((article_data, image_files))
+
+            # Read every distinct image concurrently up front; the posts below stay sequential
+            # so articles keep the news.json order in the feed
+            distinct_images = {img for _, image_files in pending_articles for img in image_files}
+            with ThreadPoolExecutor(max_workers=IMAGE_READ_WORKERS) as executor:
+                list(executor.map(load_image_bytes, distinct_images))
 
+            for article_data, image_files in pending_articles:
                 news_api.create_news(article_data, image_files if image_files else None)
     print()
 
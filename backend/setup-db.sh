@@ -63,12 +63,15 @@ echo "Running migrations..."
 python manage.py makemigrations
 python manage.py migrate
 
-# Create superuser if it doesn't exist
-echo "Creating superuser..."
+# Create superuser and moderator if they don't exist
+# One shell session and one lookup for both accounts instead of booting Django per account
+echo "Creating superuser and moderator..."
 python manage.py shell << PYTHON_EOF
 from donations.models import User
-if not User.objects.filter(email='admin@lend-a-hand.me').exists():
-    user = User.objects.create_superuser(
+existing = User.objects.in_bulk(['admin@lend-a-hand.me', 'moderator@lend-a-hand.me'], field_name='email')
+
+if 'admin@lend-a-hand.me' not in existing:
+    User.objects.create_superuser(
         email='admin@lend-a-hand.me',
         username='admin',
         password='admin',
@@ -77,14 +80,9 @@ if not User.objects.filter(email='admin@lend-a-hand.me').exists():
     print('Superuser created: admin@lend-a-hand.me / admin')
 else:
     print('Superuser already exists')
-PYTHON_EOF
 
-# Create moderator user if it doesn't exist
-echo "Creating moderator user..."
-python manage.py shell << PYTHON_EOF
-from donations.models import User
-if not User.objects.filter(email='moderator@lend-a-hand.me').exists():
-    user = User.objects.create_user(
+if 'moderator@lend-a-hand.me' not in existing:
+    User.objects.create_user(
         email='moderator@lend-a-hand.me',
         username='moderator',
         password='moderator',
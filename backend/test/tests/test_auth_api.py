@@ -1,5 +1,9 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from donations.authentication import get_token_user, user_token_cache_key
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -63,3 +67,144 @@ def test_login_with_invalid_credentials_returns_error():
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "error" in response.data
+
+
+@pytest.mark.django_db
+def test_token_user_is_cached_until_logout(settings):
+    # The test process is the only worker, so locmem stands in for the shared cache
+    settings.SHARED_CACHE = True
+    client = APIClient()
+    response = client.post(
+        reverse("register"),
+        {
+            "email": "cached@example.com",
+            "username": "cached_user",
+            "password": "StrongPass123!",
+            "password2": "StrongPass123!",
+        },
+        format="json",
+    )
+    token = response.data["token"]
+
+    assert get_token_user(token).email == "cached@example.com"
+    with CaptureQueriesContext(connection) as ctx:
+        assert get_token_user(token).email == "cached@example.com"
+    assert len(ctx.captured_queries) == 0
+
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(reverse("user-me")).status_code == status.HTTP_200_OK
+    assert not any("authtoken_token" in query["sql"] for query in ctx.captured_queries)
+
+    assert client.post(reverse("logout")).status_code == status.HTTP_200_OK
+
+    assert get_token_user(token) is None
+
+
+@pytest.mark.django_db
+def test_token_user_is_not_cached_without_shared_cache(settings):
+    settings.SHARED_CACHE = False
+    client = APIClient()
+    response = client.post(
+        reverse("register"),
+        {
+            "email": "uncached@example.com",
+            "username": "uncached_user",
+            "password": "StrongPass123!",
+            "password2": "StrongPass123!",
+        },
+        format="json",
+    )
+    token = response.data["token"]
+
+    assert get_token_user(token).email == "uncached@example.com"
+    with CaptureQueriesContext(connection) as ctx:
+        assert get_token_user(token).email == "uncached@example.com"
+    assert any("authtoken_token" in query["sql"] for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_user_saves_skip_token_invalidation_when_nothing_is_cached(settings):
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    client = APIClient()
+    response = client.post(
+        reverse("register"),
+        {
+            "email": "saver@example.com",
+            "username": "saver_user",
+            "password": "StrongPass123!",
+            "password2": "StrongPass123!",
+        },
+        format="json",
+    )
+    user = get_user_model().objects.get(id=response.data["user"]["id"])
+
+    settings.SHARED_CACHE = False
+    with CaptureQueriesContext(connection) as ctx:
+        user.save()
+    assert not any("authtoken_token" in query["sql"] for query in ctx.captured_queries)
+
+    settings.SHARED_CACHE = True
+    user.last_login = timezone.now()
+    with CaptureQueriesContext(connection) as ctx:
+        user.save(update_fields=["last_login"])
+    assert not any("authtoken_token" in query["sql"] for query in ctx.captured_queries)
+
+    with CaptureQueriesContext(connection) as ctx:
+        user.save(update_fields=["is_active"])
+    assert any("authtoken_token" in query["sql"] for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_login_ignores_process_local_token_key_cache(settings):
+    settings.SHARED_CACHE = False
+    client = APIClient()
+    response = client.post(
+        reverse("register"),
+        {
+            "email": "relogin@example.com",
+            "username": "relogin_user",
+            "password": "StrongPass123!",
+            "password2": "StrongPass123!",
+        },
+        format="json",
+    )
+    # A key another worker cached before that token was deleted on logout
+    cache.set(user_token_cache_key(response.data["user"]["id"]), "deleted-token-key")
+
+    response = client.post(
+        reverse("login"), {"email": "relogin@example.com", "password": "StrongPass123!"}, format="json"
+    )
+    token = response.data["token"]
+    assert token != "deleted-token-key"
+
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+    assert client.get(reverse("user-me")).status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_login_is_refused_after_repeated_failures(settings):
+    settings.LOGIN_FAILURE_LIMIT = 2
+    client = APIClient()
+    client.post(
+        reverse("register"),
+        {
+            "email": "locked@example.com",
+            "username": "locked_user",
+            "password": "StrongPass123!",
+            "password2": "StrongPass123!",
+        },
+        format="json",
+    )
+    login_url = reverse("login")
+
+    for _ in range(2):
+        response = client.post(login_url, {"email": "locked@example.com", "password": "wrongpass"}, format="json")
+        assert response.data["error"] == "Invalid credentials"
+
+    # Even the right password is refused until the failure window expires
+    response = client.post(login_url, {"email": "Locked@example.com", "password": "StrongPass123!"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Too many failed login attempts" in response.data["error"]
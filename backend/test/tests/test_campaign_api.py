@@ -1,6 +1,8 @@
+from io import BytesIO
 from types import SimpleNamespace
 
 import pytest
+from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test.utils import override_settings
@@ -330,3 +332,60 @@ def test_admin_resume_success(monkeypatch):
     detail = admin_client.get(reverse("campaign-detail", args=[campaign_id])).data
     assert detail["status"] == "approved"
     assert detail["moderation_notes"] == "Issue resolved."
+
+
+@pytest.mark.django_db
+def test_suspend_and_cancel_unknown_campaign_return_404():
+    token, _ = register_user("creator-missing@example.com", "creator_missing")
+    client = make_client(token)
+
+    for action_name in ("campaign-suspend", "campaign-cancel"):
+        for pk in ("abc", 999999):
+            response = client.post(reverse(action_name, args=[pk]))
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class FakeS3Client:
+    etag = '"abc123"'
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        from botocore.exceptions import ClientError
+        from botocore.response import StreamingBody
+
+        if IfNoneMatch in ("*", self.etag):
+            raise ClientError(
+                {
+                    "Error": {"Code": "304", "Message": "Not Modified"},
+                    "ResponseMetadata": {"HTTPStatusCode": 304, "HTTPHeaders": {"etag": self.etag}},
+                },
+                "GetObject",
+            )
+        body = b"image-bytes"
+        return {
+            "Body": StreamingBody(BytesIO(body), len(body)),
+            "ContentType": "image/jpeg",
+            "ContentLength": len(body),
+            "ETag": self.etag,
+        }
+
+
+@pytest.mark.django_db
+@override_settings(USE_S3_STORAGE=True)
+def test_serve_media_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(apps.get_app_config("donations"), "get_s3_client", lambda: FakeS3Client())
+    client = APIClient()
+    url = reverse("serve-media", args=["campaigns/photo.jpg"])
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] == FakeS3Client.etag
+    assert b"".join(response.streaming_content) == b"image-bytes"
+
+    cached = client.get(url, HTTP_IF_NONE_MATCH=FakeS3Client.etag)
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached["ETag"] == FakeS3Client.etag
+
+    # A wildcard match answers with the stored ETag, not the client's header
+    cached = client.get(url, HTTP_IF_NONE_MATCH="*")
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached["ETag"] == FakeS3Client.etag
@@ -2,6 +2,7 @@ from decimal import Decimal
 from types import SimpleNamespace
 
 import pytest
+from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
@@ -181,3 +182,48 @@ def test_confirm_payment_updates_campaign_progress(monkeypatch):
     donations = list_results(donations_response)
     assert len(donations) == 1
     assert Decimal(donations[0]["amount"]) == Decimal("50")
+
+    # Confirming the same session again must not double count the donation
+    replay_response = owner_client.post(
+        reverse("donation-confirm-payment"),
+        {"session_id": "cs_test"},
+        format="json",
+    )
+    assert replay_response.status_code == status.HTTP_200_OK
+    assert replay_response.data["donation"]["id"] == donations[0]["id"]
+    detail_response = owner_client.get(reverse("campaign-detail", args=[campaign_id]))
+    assert Decimal(detail_response.data["current_amount"]) == Decimal("50")
+
+    # A replay repairs a drifted total without touching other columns
+    campaign_model = apps.get_model("donations", "Campaign")
+    campaign_model.objects.filter(id=campaign_id).update(current_amount=0, moderation_notes="Edited meanwhile")
+    replay_response = owner_client.post(
+        reverse("donation-confirm-payment"),
+        {"session_id": "cs_test"},
+        format="json",
+    )
+    assert replay_response.status_code == status.HTTP_200_OK
+    campaign = campaign_model.objects.get(id=campaign_id)
+    assert campaign.current_amount == Decimal("50")
+    assert campaign.moderation_notes == "Edited meanwhile"
+
+
+@pytest.mark.django_db
+def test_stripe_webhook_database_error_is_not_leaked(settings, monkeypatch):
+    from django.db import IntegrityError
+
+    settings.STRIPE_WEBHOOK_SECRET = ""
+
+    def failing_record_donation(*_args):
+        raise IntegrityError('duplicate key value violates unique constraint "donation_intent_uniq"')
+
+    monkeypatch.setattr("donations.views.record_donation", failing_record_donation)
+    event = {
+        "type": "checkout.session.completed",
+        "data": {"object": {"metadata": {"campaign_id": "1"}, "amount_total": 5000, "payment_intent": "pi_leak"}},
+    }
+
+    response = APIClient().post(reverse("stripe-webhook"), event, format="json")
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert "donation_intent_uniq" not in response.content.decode()
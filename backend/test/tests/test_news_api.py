@@ -1,4 +1,5 @@
 import pytest
+from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test.utils import override_settings
@@ -161,3 +162,74 @@ def test_regular_user_cannot_delete_news():
 
     detail_response = mod_client.get(reverse("news-detail", args=[news_id]))
     assert detail_response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_public_news_list_is_cached_until_news_changes(settings, django_capture_on_commit_callbacks):
+    settings.SHARED_CACHE = True
+    mod_token, mod_user = register_user("mod-cache@example.com", "mod_cache")
+    promote_to_moderator(mod_user["id"])
+    mod_client = make_client(mod_token)
+    anonymous_client = APIClient()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_news(mod_client, "First", "Visible", published=True)
+    assert [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))] == ["First"]
+
+    # Writes that bypass the model signals don't invalidate the cached page
+    news_model = apps.get_model("donations", "News")
+    news_model.objects.filter(title="First").update(title="Renamed")
+    assert [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))] == ["First"]
+    # Parameters the view ignores share the cached page instead of creating new entries
+    response = anonymous_client.get(reverse("news-list"), {"x": "1"})
+    assert [item["title"] for item in list_results(response)] == ["First"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_news(mod_client, "Second", "Visible", published=True)
+    titles = [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))]
+    assert titles == ["Second", "Renamed"]
+
+
+@pytest.mark.django_db
+def test_news_edit_during_list_query_is_not_cached_stale(settings, monkeypatch, django_capture_on_commit_callbacks):
+    from donations import caching, views
+
+    settings.SHARED_CACHE = True
+    mod_token, mod_user = register_user("mod-race@example.com", "mod_race")
+    promote_to_moderator(mod_user["id"])
+    mod_client = make_client(mod_token)
+    anonymous_client = APIClient()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_news(mod_client, "Before", "Visible", published=True)
+
+    news_model = apps.get_model("donations", "News")
+
+    def set_after_concurrent_edit(*args):
+        # An edit commits after the rows were loaded but before the page is stored
+        news_model.objects.filter(title="Before").update(title="After")
+        caching.invalidate_news()
+        caching.set_news_list(*args)
+
+    monkeypatch.setattr(views, "set_news_list", set_after_concurrent_edit)
+    assert [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))] == ["Before"]
+
+    monkeypatch.setattr(views, "set_news_list", caching.set_news_list)
+    assert [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))] == ["After"]
+
+
+@pytest.mark.django_db
+def test_public_news_list_is_not_cached_without_shared_cache(settings, django_capture_on_commit_callbacks):
+    settings.SHARED_CACHE = False
+    mod_token, mod_user = register_user("mod-nocache@example.com", "mod_nocache")
+    promote_to_moderator(mod_user["id"])
+    mod_client = make_client(mod_token)
+    anonymous_client = APIClient()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_news(mod_client, "First", "Visible", published=True)
+    assert [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))] == ["First"]
+
+    news_model = apps.get_model("donations", "News")
+    news_model.objects.filter(title="First").update(title="Renamed")
+    assert [item["title"] for item in list_results(anonymous_client.get(reverse("news-list")))] == ["Renamed"]